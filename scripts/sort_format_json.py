@@ -1,28 +1,48 @@
-import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
 data_path = 'wmn-data.json'
 schema_path = 'wmn-data-schema.json'
 
+def loads_json(content):
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def dumps_json(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 def sort_array_alphabetically(arr):
     return sorted(arr, key=str.lower)
 
-def reorder_object_keys(obj, key_order):
-    reordered = {k: obj[k] for k in key_order if k in obj}
-    for k in obj:
-        if k not in key_order:
-            reordered[k] = obj[k]
-    return reordered
+def get_site_key_order(schema):
+    site_schema = schema.get('properties', {}).get('sites', {}).get('items', {})
+    key_order = tuple(site_schema.get('properties', {}).keys())
+    return key_order, frozenset(key_order)
 
-def sort_headers(site):
-    headers = site.get("headers")
-    if isinstance(headers, dict):
-        site["headers"] = dict(sorted(headers.items(), key=lambda item: item[0].lower()))
+def format_site(site, key_order, key_order_set):
+    formatted = {}
+    for k in key_order:
+        if k in site:
+            value = site[k]
+            if k == "headers" and isinstance(value, dict) and len(value) > 1:
+                value = dict(sorted(value.items(), key=lambda item: item[0].lower()))
+            formatted[k] = value
+    for k in site:
+        if k not in key_order_set:
+            formatted[k] = site[k]
+    return formatted
 
 def load_and_format_json(path):
-    with open(path, 'r', encoding='utf-8') as f:
+    with open(path, 'rb') as f:
         raw_content = f.read()
-        data = json.loads(raw_content)
-    formatted = json.dumps(data, indent=2, ensure_ascii=False)
+        data = loads_json(raw_content)
+    formatted = dumps_json(data)
     return data, raw_content, formatted
 
 data, data_raw, data_formatted = load_and_format_json(data_path)
@@ -38,20 +58,18 @@ if isinstance(data.get('categories'), list):
     data['categories'] = sort_array_alphabetically(data['categories'])
 
 # Sort and reorder sites
-site_schema = schema.get('properties', {}).get('sites', {}).get('items', {})
-key_order = list(site_schema.get('properties', {}).keys())
+key_order, key_order_set = get_site_key_order(schema)
 
-if isinstance(data.get('sites'), list):
-    data['sites'].sort(key=lambda site: site.get('name', '').lower())
-    for site in data['sites']:
-        sort_headers(site)
-    data['sites'] = [reorder_object_keys(site, key_order) for site in data['sites']]
+sites = data.get('sites')
+if isinstance(sites, list):
+    sites.sort(key=lambda site: site.get('name', '').lower())
+    data['sites'] = [format_site(site, key_order, key_order_set) for site in sites]
 
-updated_data_formatted = json.dumps(data, indent=2, ensure_ascii=False)
+updated_data_formatted = dumps_json(data)
 
 # Write wmn-data.json if changed
 if data_raw.strip() != updated_data_formatted.strip():
-    with open(data_path, 'w', encoding='utf-8') as f:
+    with open(data_path, 'wb') as f:
         f.write(updated_data_formatted)
     print("Updated and sorted wmn-data.json.")
     changed = True
@@ -60,7 +78,7 @@ else:
 
 # Write formatted wmn-data-schema.json if changed
 if schema_raw.strip() != schema_formatted.strip():
-    with open(schema_path, 'w', encoding='utf-8') as f:
+    with open(schema_path, 'wb') as f:
         f.write(schema_formatted)
     print("Formatted wmn-data-schema.json.")
     changed = True